@@ -0,0 +1,116 @@
+import argparse
+import functools
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+
+@functools.lru_cache(maxsize=None)
+def _is_file(path):
+    """
+    Single os.stat per path (each one is a network round-trip on a share).
+    Cached for the life of the process; call _is_file.cache_clear() to re-check.
+    """
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def _forward(stream, out):
+    """Copy lines from a pipe to one of our streams as they arrive."""
+    for line in stream:
+        out.write(line)
+        out.flush()
+
+
+def _run_piped(cmd):
+    """Run the command with piped stdout/stderr and stream both as they arrive."""
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1) as proc:
+        # Drain stderr on its own thread so a chatty stderr can't fill its pipe and
+        # stall the command while we are reading stdout (select() can't wait on
+        # pipes on Windows).
+        stderr_thread = threading.Thread(target=_forward, args=(proc.stderr, sys.stderr))
+        stderr_thread.start()
+        print("STDOUT:")
+        _forward(proc.stdout, sys.stdout)
+        stderr_thread.join()
+    return proc.returncode
+
+
+def _run_pty(cmd):
+    """Run the command in a pseudo-terminal to capture interactive output."""
+    # Only needed (and only installable) on Windows, so import it on demand
+    import pywinpty
+
+    command_line = subprocess.list2cmdline(cmd)
+    with pywinpty.PtyProcess.spawn(command_line) as proc:
+        # Echo everything printed to the terminal as it arrives, until the process exits
+        # This may include all interactive screen content
+        print("----- Captured Output -----")
+        while True:
+            try:
+                chunk = proc.read(1024)  # Read 1KB at a time
+            except EOFError:
+                break
+            if not chunk:
+                # An empty read only means "nothing yet" while the process is running
+                if not proc.isalive():
+                    break
+                time.sleep(0.05)
+                continue
+            sys.stdout.write(chunk)
+            sys.stdout.flush()
+        print()
+        # EOF on the pty can arrive before the process has exited; wait for its status
+        proc.wait()
+        # An unknown exit status must not read as success
+        return proc.exitstatus if proc.exitstatus is not None else 1
+
+
+def run_status(eac_path, yaml_path, pty=False):
+    """
+    Run `eac deployment status -f <yaml_path>` and stream its output.
+
+    Args:
+        eac_path (str): Path to eac.exe
+        yaml_path (str): Path to the deployment YAML file
+        pty (bool): Run inside a pseudo-terminal (pywinpty) instead of pipes
+
+    Returns:
+        int: Exit code from the command, or 1 if a path is missing
+    """
+    # Make sure the files exist before running; each path is stat-ed at most once per process
+    eac_exists = _is_file(eac_path)
+    yaml_exists = _is_file(yaml_path)
+    print(f"Checking paths before running command:")
+    print(f"EAC executable: {eac_path} Exists? {eac_exists}")
+    print(f"YAML file: {yaml_path} Exists? {yaml_exists}")
+    print("-" * 60)
+
+    if not eac_exists:
+        print("ERROR: Cannot find eac.exe at the specified path.")
+        return 1
+    if not yaml_exists:
+        print(f"ERROR: Cannot find {os.path.basename(yaml_path)} at the specified path.")
+        return 1
+
+    cmd = [eac_path, "deployment", "status", "-f", yaml_path]
+    return _run_pty(cmd) if pty else _run_piped(cmd)
+
+
+def main(argv=None):
+    """Command-line entry point shared by the status scripts."""
+    parser = argparse.ArgumentParser(description="Show EAC deployment status for a deployment YAML file")
+    parser.add_argument("eac_path", help="Path to eac.exe")
+    parser.add_argument("yaml_path", help="Path to the deployment YAML file")
+    parser.add_argument("--pty", action="store_true", help="Run eac in a pseudo-terminal (pywinpty) to capture interactive output")
+    args = parser.parse_args(argv)
+    return run_status(args.eac_path, args.yaml_path, pty=args.pty)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
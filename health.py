@@ -1,22 +1,179 @@
+import bisect
+import collections
+import functools
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
 import yaml
-import boto3
-from botocore.exceptions import ClientError
+import botocore.session
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+# orjson is optional; it only speeds up reading tooling-generated JSON sidecars.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# pyahocorasick is optional; without it ResourceIndex matches names one at a time.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one if PyYAML
+# was built without it.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Upper bound on concurrent health checks; also sizes each client's HTTP pool
+# so no worker thread waits on a connection.
+MAX_WORKERS = 32
+
+# The report buffer of the component being checked on this thread, if any;
+# diagnostics go there so each component's block stays contiguous.
+_report = threading.local()
 
 class ClientManager:
     """
     Manages and caches Boto3 clients.
     Clients are created on-demand the first time they are requested.
     """
-    def __init__(self, region=None):
+    def __init__(self, region=None, component_names=(), component_types=()):
         self._clients = {}
+        # Names the checks will look up; lets ResourceIndex match them all in one pass.
+        self.component_names = frozenset(component_names)
+        # How many components of each type will be checked; lets a check decide
+        # whether batching its lookups pays off.
+        self.type_counts = collections.Counter(component_types)
+        self._results = {}
+        self._result_locks = {}
+        self._lock = threading.Lock()
         self.region = region
+        # One botocore session for every client, so config files, credentials and
+        # endpoint data are loaded once.
+        self._session = botocore.session.Session()
+        self._config = Config(
+            retries={'max_attempts': 3, 'mode': 'adaptive'},
+            max_pool_connections=MAX_WORKERS,
+            tcp_keepalive=True,
+        )
 
     def get(self, service_name, region_override=None):
-        if service_name not in self._clients:
-            # Create the client if it doesn't exist in our cache
-            print(f"    (Initializing Boto3 client for '{service_name}'...)")
-            self._clients[service_name] = boto3.client(service_name, region_name=region_override or self.region)
-        return self._clients[service_name]
+        # Health checks run on worker threads; the lock keeps two of them from
+        # racing to create the same client. Boto3 clients are thread-safe once built.
+        with self._lock:
+            if service_name not in self._clients:
+                # Create the client if it doesn't exist in our cache
+                print(f"    (Initializing Boto3 client for '{service_name}'...)", file=getattr(_report, 'buf', None) or sys.stdout)
+                self._clients[service_name] = self._session.create_client(
+                    service_name, region_name=region_override or self.region, config=self._config
+                )
+            return self._clients[service_name]
+
+    def cached(self, key, loader):
+        """Computes loader() the first time `key` is requested and caches the result."""
+        with self._lock:
+            result_lock = self._result_locks.setdefault(key, threading.Lock())
+        # A per-key lock lets other services fetch in parallel while threads
+        # asking for this one wait for the first fetch instead of repeating it.
+        with result_lock:
+            if key not in self._results:
+                self._results[key] = loader()
+            return self._results[key]
+
+    def resolve_credentials(self):
+        """
+        Walks the credential provider chain once, up front. The shared session
+        keeps the result, so clients created later (from any thread) reuse it
+        instead of each probing env vars, config files and instance metadata.
+        Returns None when no credentials are available.
+        """
+        return self._session.get_credentials()
+
+    def describe_once(self, service_name, method, result_key):
+        """
+        Returns the full, paginated result list of a describe/list call.
+        The call is made at most once per manager; every component of the same
+        type then filters the shared result locally.
+        """
+        def fetch():
+            paginator = self.get(service_name).get_paginator(method)
+            return paginator.paginate().build_full_result().get(result_key, [])
+        return self.cached((service_name, method), fetch)
+
+    def is_loaded(self, service_name, method):
+        """True once describe_once has fetched this call's full result."""
+        return (service_name, method) in self._results
+
+    def index_once(self, service_name, method, result_key, id_key):
+        """Returns a ResourceIndex over the result of describe_once, built once."""
+        return self.cached(
+            (service_name, method, id_key),
+            lambda: ResourceIndex(
+                self.describe_once(service_name, method, result_key), id_key, self.component_names
+            ),
+        )
+
+
+class ResourceIndex:
+    """
+    Looks up AWS resources by identifier.
+    Exact matches are a dict hit. "Contains" matches search one newline-joined
+    string of all identifiers, so each lookup is a single C-level scan instead
+    of a Python loop over every resource.
+    When the names to look up are known in advance and pyahocorasick is
+    installed, every "contains" match is found up front in a single
+    Aho-Corasick pass over the identifiers.
+    """
+    def __init__(self, resources, id_key, names=()):
+        identifiers = [r[id_key] for r in resources]
+        self._resources = resources
+        self._by_id = {}
+        self._starts = []
+        offset = 0
+        for identifier, resource in zip(identifiers, resources):
+            self._by_id.setdefault(identifier, resource)
+            self._starts.append(offset)
+            offset += len(identifier) + 1
+        self._haystack = "\n".join(identifiers)
+        self._contains = self._match_all(identifiers, names) if ahocorasick else None
+
+    def _match_all(self, identifiers, names):
+        """Maps each name to the first resource whose identifier contains it (or None)."""
+        automaton = ahocorasick.Automaton()
+        for name in names:
+            if isinstance(name, str) and name:
+                automaton.add_word(name, name)
+        if not len(automaton):
+            return {}
+        automaton.make_automaton()
+        contains = dict.fromkeys(automaton.keys())
+        for identifier, resource in zip(identifiers, self._resources):
+            for _, name in automaton.iter(identifier):
+                if contains[name] is None:
+                    contains[name] = resource
+        return contains
+
+    def find(self, name):
+        """Returns the resource named `name`, else the first one whose identifier contains it."""
+        resource = self._by_id.get(name)
+        if resource is not None:
+            return resource
+        if self._contains is not None and name in self._contains:
+            return self._contains[name]
+        pos = self._haystack.find(name)
+        if pos == -1:
+            return None
+        return self._resources[bisect.bisect_right(self._starts, pos) - 1]
 
 # --- Central Client Manager ---
 # Create a single instance of the manager to be used by all check functions.
@@ -31,38 +188,83 @@ def _check_rds_aurora(name, properties):
     # We'll assume the variable part is not known, so we search for a cluster
     # whose name *contains* the component name as a fallback.
     try:
-        rds_client = client_manager.get('rds')
-        clusters = rds_client.describe_db_clusters()['DBClusters']
-        # A more robust method would be to filter by tags if they are consistent.
-        cluster = next((c for c in clusters if name in c['DBClusterIdentifier']), None)
+        cluster = None
+        if not client_manager.is_loaded('rds', 'describe_db_clusters'):
+            # Ask RDS for the exact identifier first; only pull the whole
+            # inventory when that misses.
+            cluster_id = properties.get('custom_cluster_name') or name
+            if '${' in str(cluster_id):
+                cluster_id = name
+            try:
+                response = client_manager.get('rds').describe_db_clusters(DBClusterIdentifier=cluster_id)
+                cluster = response['DBClusters'][0] if response['DBClusters'] else None
+            except ClientError as e:
+                if e.response['Error']['Code'] not in ('DBClusterNotFoundFault', 'InvalidParameterValue'):
+                    raise
+        if cluster is None:
+            clusters = client_manager.index_once('rds', 'describe_db_clusters', 'DBClusters', 'DBClusterIdentifier')
+            # A more robust method would be to filter by tags if they are consistent.
+            cluster = clusters.find(name)
         if cluster:
             return f"Found Cluster: {cluster['DBClusterIdentifier']}, Status: {cluster['Status']}"
         return f"Cluster containing name '{name}' not found."
     except ClientError as e:
         return f"AWS API Error: {e.response['Error']['Message']}"
 
+def _describe_management_hosts(names):
+    """
+    Finds the EC2 instance behind each ManagementHost name in one batch.
+    One describe_instances call OR-s all the Name-tag patterns together and one
+    describe_instance_status call covers every matched instance.
+    Returns {name: (instance, instance_status)}; unmatched names map to None and
+    instance_status is None when status checks are unavailable.
+    """
+    # A common convention is to have a 'Name' tag.
+    ec2_client = client_manager.get('ec2')
+    filters = [{'Name': 'tag:Name', 'Values': [f'*{name}*' for name in names]}]
+    # Paginated: a filtered describe_instances can split (or withhold) matches
+    # across pages.
+    pages = ec2_client.get_paginator('describe_instances').paginate(Filters=filters)
+    instances = [
+        (next((t['Value'] for t in i.get('Tags', []) if t['Key'] == 'Name'), ''), i)
+        for page in pages for r in page['Reservations'] for i in r['Instances']
+    ]
+
+    matched = {name: next((i for tag, i in instances if name in tag), None) for name in names}
+    instance_ids = list({i['InstanceId'] for i in matched.values() if i})
+    statuses = {}
+    if instance_ids:
+        # For a deeper health check, look at instance status checks
+        status_res = ec2_client.describe_instance_status(InstanceIds=instance_ids, IncludeAllInstances=True)
+        statuses = {s['InstanceId']: s for s in status_res['InstanceStatuses']}
+
+    return {
+        name: (instance, statuses.get(instance['InstanceId'])) if instance else None
+        for name, instance in matched.items()
+    }
+
 def _check_management_host(name, properties):
     """Health check for ManagementHost (EC2 Instance)."""
     # EC2 instances are best found via tags. Your YAML specifies tags.
     # We will assume a 'Name' tag is created based on the component name.
     try:
-        # A common convention is to have a 'Name' tag.
-        ec2_client = client_manager.get('ec2')
-        filters = [{'Name': 'tag:Name', 'Values': [f'*{name}*']}]
-        reservations = ec2_client.describe_instances(Filters=filters)['Reservations']
-        
-        if not reservations or not reservations[0]['Instances']:
+        # The main block prefetches every ManagementHost in one batch; a host
+        # checked on its own falls back to a batch of one.
+        hosts = client_manager.cached('management_hosts', dict)
+        if name not in hosts:
+            hosts = _describe_management_hosts([name])
+        host = hosts[name]
+
+        if not host:
             return f"Instance with name tag like '*{name}*' not found."
 
-        instance = reservations[0]['Instances'][0]
+        instance, instance_status = host
         instance_id = instance['InstanceId']
         state = instance['State']['Name']
         
-        # For a deeper health check, look at instance status checks
-        status_res = ec2_client.describe_instance_status(InstanceIds=[instance_id], IncludeAllInstances=True)
-        if status_res['InstanceStatuses']:
-            i_status = status_res['InstanceStatuses'][0]['InstanceStatus']['Status']
-            s_status = status_res['InstanceStatuses'][0]['SystemStatus']['Status']
+        if instance_status:
+            i_status = instance_status['InstanceStatus']['Status']
+            s_status = instance_status['SystemStatus']['Status']
             return f"Found Instance: {instance_id}, State: {state}, InstanceStatus: {i_status}, SystemStatus: {s_status}"
         
         return f"Found Instance: {instance_id}, State: {state}. Status checks not available (may be stopped)."
@@ -72,10 +274,18 @@ def _check_management_host(name, properties):
 def _check_load_balancer(name, properties):
     """Health check for ApplicationLoadBalancer and NetworkLoadBalancer."""
     try:
-        elbv2_client = client_manager.get('elbv2')
-        lbs = elbv2_client.describe_load_balancers()['LoadBalancers']
-        # Search for a load balancer where the name from YAML is part of the real name
-        lb = next((l for l in lbs if name in l['LoadBalancerName']), None)
+        lb = None
+        if not client_manager.is_loaded('elbv2', 'describe_load_balancers'):
+            # Try the exact name server-side before listing every load balancer.
+            try:
+                lb = client_manager.get('elbv2').describe_load_balancers(Names=[name])['LoadBalancers'][0]
+            except ClientError as e:
+                if e.response['Error']['Code'] not in ('LoadBalancerNotFound', 'ValidationError'):
+                    raise
+        if lb is None:
+            lbs = client_manager.index_once('elbv2', 'describe_load_balancers', 'LoadBalancers', 'LoadBalancerName')
+            # Search for a load balancer where the name from YAML is part of the real name
+            lb = lbs.find(name)
         if lb:
             return f"Found LB: {lb['LoadBalancerName']}, State: {lb['State']['Code']}"
         return f"Load Balancer containing name '{name}' not found."
@@ -88,9 +298,8 @@ def _check_iam_role(name, properties):
     # The YAML has `byo: ${ecs_role_name}` or `name: ${lambda_role_name}`.
     # This is hard to resolve here, so we'll check for the component name as a substring.
     try:
-        iam_client = client_manager.get('iam')
-        roles = iam_client.list_roles()['Roles']
-        role = next((r for r in roles if name in r['RoleName']), None)
+        roles = client_manager.index_once('iam', 'list_roles', 'Roles', 'RoleName')
+        role = roles.find(name)
         if role:
              return f"Found Role containing name: {role['RoleName']}"
         return f"Role containing name '{name}' not found."
@@ -111,6 +320,22 @@ def _check_ecs_cluster(name, properties):
     except ClientError as e:
         return f"AWS API Error: {e.response['Error']['Message']}"
 
+def _load_kms_aliases():
+    """
+    Maps every alias in the account to its target key id, via one paginated
+    list_aliases. Returns None when the role lacks kms:ListAliases, so callers
+    fall back to describing each alias directly.
+    """
+    try:
+        return {
+            a['AliasName']: a.get('TargetKeyId')
+            for a in client_manager.describe_once('kms', 'list_aliases', 'Aliases')
+        }
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'AccessDeniedException':
+            return None
+        raise
+
 def _check_kms_key(name, properties):
     """Health check for KMS Key."""
     # The alias is defined in the properties.
@@ -118,11 +343,26 @@ def _check_kms_key(name, properties):
     if not alias_name:
         return "Skipped: 'key_alias' not defined in properties."
     try:
-        # KMS aliases are prefixed with 'alias/'
-        kms_client = client_manager.get('kms')
-        response = kms_client.describe_key(KeyId=f'alias/{alias_name}')
-        key_id = response['KeyMetadata']['KeyId']
-        state = response['KeyMetadata']['KeyState']
+        # Several KMS components: one list_aliases serves them all, and describe_key
+        # is then only needed once per distinct target key.
+        aliases = None
+        if client_manager.type_counts['KMS'] > 1:
+            aliases = client_manager.cached('kms_aliases', _load_kms_aliases)
+        if aliases is not None:
+            # KMS aliases are prefixed with 'alias/'
+            target_key_id = aliases.get(f'alias/{alias_name}')
+            if not target_key_id:
+                return f"KMS Key with alias '{alias_name}' not found."
+            metadata = client_manager.cached(
+                ('kms', target_key_id),
+                lambda: client_manager.get('kms').describe_key(KeyId=target_key_id)['KeyMetadata'],
+            )
+        else:
+            # KMS aliases are prefixed with 'alias/'
+            kms_client = client_manager.get('kms')
+            metadata = kms_client.describe_key(KeyId=f'alias/{alias_name}')['KeyMetadata']
+        key_id = metadata['KeyId']
+        state = metadata['KeyState']
         return f"Found Key: {key_id} via alias '{alias_name}', State: {state}"
     except ClientError as e:
         if e.response['Error']['Code'] == 'NotFoundException':
@@ -146,13 +386,307 @@ HEALTH_CHECK_REGISTRY = {
     # "Lambda": _check_lambda_function,
 }
 
-def get_deployment_config(file_path):
-    """Parses the entire deployment file."""
+# Shared read-only default for components without properties.
+_EMPTY = types.MappingProxyType({})
+
+class Component:
+    """
+    One entry of the deployment's `components` list.
+    Built once per component so the check loop reads slots instead of
+    repeating dict lookups.
+    """
+    __slots__ = ('type', 'name', 'properties')
+
+    def __init__(self, type, name, properties=_EMPTY):
+        if isinstance(type, str):
+            # Registry keys are interned literals; interning the YAML value lets
+            # registry lookups match on identity instead of comparing characters.
+            type = sys.intern(type)
+        self.type = type
+        self.name = name
+        self.properties = properties
+
+    @classmethod
+    def from_mapping(cls, data):
+        """Builds a Component from a parsed YAML mapping."""
+        return cls(data.get('type'), data.get('name'), data.get('properties') or _EMPTY)
+
+def _dig(data, *keys, default=None):
+    """Follows dict keys / list indexes into nested data, returning `default` on any miss."""
+    try:
+        for key in keys:
+            data = data[key]
+        return data
+    except (KeyError, IndexError, TypeError):
+        return default
+
+# --- Deployment File Loading ---
+# The only parts of deployment.yaml the health checks read.
+HEALTH_CHECK_PATHS = (
+    ('components',),
+    ('spec', 'modulepak', 0, 'environment', 'awsRegion'),
+)
+
+def _prune_node(loader, node, paths):
+    """
+    Constructs only the parts of a composed YAML node reached by `paths`.
+    Mappings and sequences along the way keep their shape (skipped sequence
+    items become None), so callers can walk the result like the full document.
+    """
+    if any(not path for path in paths):
+        return loader.construct_document(node)
+    children = _group_paths(paths)
+
+    if isinstance(node, yaml.MappingNode):
+        # Resolve `<<` merge keys so merged entries are found too.
+        loader.flatten_mapping(node)
+        result = {}
+        for key_node, value_node in node.value:
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value in children:
+                result[key_node.value] = _prune_node(loader, value_node, children[key_node.value])
+        return result
+    if isinstance(node, yaml.SequenceNode):
+        wanted = [i for i in children if isinstance(i, int) and i < len(node.value)]
+        result = [None] * (max(wanted) + 1) if wanted else []
+        for i in wanted:
+            result[i] = _prune_node(loader, node.value[i], children[i])
+        return result
+    return None
+
+class _NeedsFullCompose(Exception):
+    """Raised when the event-level filter meets YAML it cannot handle on its own."""
+
+def _group_paths(paths):
+    """Groups key paths by their first element: {head: [rest, ...]}."""
+    children = {}
+    for head, *rest in paths:
+        children.setdefault(head, []).append(tuple(rest))
+    return children
+
+def _record_anchor(anchors, anchor, node):
+    """Registers an anchor; a re-defined one is left for the full composer to reject."""
+    if anchor is not None:
+        if anchor in anchors:
+            raise _NeedsFullCompose()
+        anchors[anchor] = node
+
+def _skip_events(loader, anchors):
+    """
+    Consumes the events of one node without building anything. Anchors defined
+    in it are recorded (with no node) so duplicates are still detected.
+    """
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if not isinstance(event, yaml.AliasEvent):
+            _record_anchor(anchors, getattr(event, 'anchor', None), None)
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+def _compose_events(loader, anchors):
+    """Builds a YAML node from the next events, the same way PyYAML's Composer does."""
+    event = loader.get_event()
+    if isinstance(event, yaml.AliasEvent):
+        node = anchors.get(event.anchor)
+        if node is None:
+            # The anchor was defined in a part of the document we skipped (or
+            # not at all; the full composer reports that).
+            raise _NeedsFullCompose()
+        return node
+
+    tag = event.tag
+    if isinstance(event, yaml.ScalarEvent):
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+        _record_anchor(anchors, event.anchor, node)
+        return node
+
+    if isinstance(event, yaml.SequenceStartEvent):
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        end_event = yaml.SequenceEndEvent
+    else:
+        if tag is None or tag == '!':
+            tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        end_event = yaml.MappingEndEvent
+    _record_anchor(anchors, event.anchor, node)
+    while not loader.check_event(end_event):
+        if end_event is yaml.SequenceEndEvent:
+            node.value.append(_compose_events(loader, anchors))
+        else:
+            node.value.append((_compose_events(loader, anchors), _compose_events(loader, anchors)))
+    node.end_mark = loader.get_event().end_mark
+    return node
+
+def _select_events(loader, paths, anchors):
+    """
+    Consumes one node's events, constructing Python objects only along `paths`.
+    Everything else is skipped at the event level, so no nodes or objects are
+    created for it. The result has the same shape as _prune_node's.
+    """
+    if any(not path for path in paths):
+        return loader.construct_document(_compose_events(loader, anchors))
+    children = _group_paths(paths)
+
+    event = loader.get_event()
+    if isinstance(event, yaml.AliasEvent):
+        raise _NeedsFullCompose()
+    # No node is built here, so an alias to this anchor also needs the full composer.
+    _record_anchor(anchors, event.anchor, None)
+    if isinstance(event, yaml.MappingStartEvent):
+        result = {}
+        while not loader.check_event(yaml.MappingEndEvent):
+            key_event = loader.peek_event()
+            if isinstance(key_event, yaml.ScalarEvent) and key_event.value == '<<':
+                # Merge keys need the merged mapping, which may be anywhere.
+                raise _NeedsFullCompose()
+            if isinstance(key_event, yaml.ScalarEvent) and key_event.value in children:
+                _record_anchor(anchors, loader.get_event().anchor, None)
+                result[key_event.value] = _select_events(loader, children[key_event.value], anchors)
+            else:
+                _skip_events(loader, anchors)
+                _skip_events(loader, anchors)
+        loader.get_event()
+        return result
+    if isinstance(event, yaml.SequenceStartEvent):
+        wanted = [i for i in children if isinstance(i, int)]
+        last = max(wanted) if wanted else -1
+        result = []
+        index = 0
+        while not loader.check_event(yaml.SequenceEndEvent):
+            if index in children:
+                result.append(_select_events(loader, children[index], anchors))
+            else:
+                _skip_events(loader, anchors)
+                if index < last:
+                    result.append(None)
+            index += 1
+        loader.get_event()
+        # Like _prune_node, stop after the last wanted index the sequence actually has.
+        del result[max((i for i in wanted if i < index), default=-1) + 1:]
+        return result
+    # A scalar where the path expected a mapping or sequence.
+    return None
+
+def _parse_yaml(stream, only=None):
+    """
+    Parses a YAML stream. With `only`, a tuple of key paths, libyaml's event
+    stream is filtered so nodes and Python objects are built just for those
+    paths; the rest of the document is parsed but never materialized.
+    Documents the filter cannot handle (merge keys or aliases along the way)
+    are composed in full and pruned with _prune_node instead.
+    """
+    if only is None:
+        return yaml.load(stream, Loader=_Loader)
+    loader = _Loader(stream)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            return None
+        loader.get_event()  # DocumentStartEvent
+        data = _select_events(loader, only, {})
+        loader.get_event()  # DocumentEndEvent
+        if not loader.check_event(yaml.StreamEndEvent):
+            # More than one document; the full composer raises the usual error.
+            raise _NeedsFullCompose()
+        return data
+    except _NeedsFullCompose:
+        pass
+    finally:
+        loader.dispose()
+
+    stream.seek(0)
+    loader = _Loader(stream)
+    try:
+        root = loader.get_single_node()
+        return _prune_node(loader, root, only) if root is not None else None
+    finally:
+        loader.dispose()
+
+def _cache_dir():
+    """
+    Per-user directory for parse caches. Pickles are only ever loaded from here,
+    never from next to the YAML, since deployment files often sit on shared
+    paths others can write to (and unpickling runs arbitrary code).
+    """
+    base = os.environ.get('LOCALAPPDATA') if os.name == 'nt' else os.environ.get('XDG_CACHE_HOME')
+    return os.path.join(base or os.path.join(os.path.expanduser('~'), '.cache'), 'eac-health')
+
+def _load_yaml_cached(path, only=None):
+    """
+    Loads a YAML file, reusing a pickled copy of the parsed data when possible.
+    The pickle lives in the per-user _cache_dir(), named after the file's absolute
+    path and keyed by its mtime and size, so any edit to the YAML invalidates it.
+    If tooling emitted a JSON copy at `<path>.json` that is at least as new as the
+    YAML, that is read instead (JSON is far cheaper to parse than YAML); an
+    unreadable, corrupt or non-mapping JSON file is ignored.
+    """
+    stat = os.stat(path)
+    try:
+        json_stat = os.stat(path + ".json")
+    except OSError:
+        json_stat = None
+    if json_stat and json_stat.st_mtime_ns >= stat.st_mtime_ns:
+        try:
+            with open(path + ".json", 'rb') as f:
+                data = _json_loads(f.read())
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict):
+            return data
+
+    key = (stat.st_mtime_ns, stat.st_size, only)
+    cache_dir = _cache_dir()
+    cache_path = os.path.join(cache_dir, hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest() + ".pkl")
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        # Missing, stale-format or corrupt cache: fall through and re-parse.
+        pass
+
+    with open(path, 'r') as f:
+        data = _parse_yaml(f, only)
+
+    # Write to a temp file and rename so a concurrent reader never sees a partial pickle.
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    except OSError:
+        # The cache is only an optimization; an unwritable cache directory is fine.
+        return data
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        os.unlink(tmp_path)
+    return data
+
+@functools.lru_cache(maxsize=8)
+def _parse_cached(path, mtime_ns, size, only):
+    """In-process cache over _load_yaml_cached; the stat fields invalidate it on edits."""
+    return _load_yaml_cached(path, only)
+
+def get_deployment_config(file_path, only=None):
+    """
+    Parses the deployment file.
+    Pass `only` (e.g. HEALTH_CHECK_PATHS) to load just those key paths.
+    Repeated calls for an unchanged file return the same (shared) object.
+    """
     print(f"Reading configuration from: {file_path}\n")
     try:
-        with open(file_path, 'r') as f:
-            deployment_data = yaml.safe_load(f)
-            return deployment_data
+        stat = os.stat(file_path)
+        return _parse_cached(file_path, stat.st_mtime_ns, stat.st_size, only)
     except FileNotFoundError:
         print(f"Error: The file {file_path} was not found.")
         return None
@@ -160,71 +694,88 @@ def get_deployment_config(file_path):
         print(f"Error parsing YAML file: {e}")
         return None
 
+# Report fragments reused for every component.
+_SEP = "-" * 30 + "\n"
+_SKIP_MSG = "Skipping component with missing type or name.\n" + _SEP
+_CHECK_FMT = "Checking {}: {}\n".format
 
-
-
-def get_components_from_deployment(file_path):
-    """Parses a deployment.yaml file and extracts component info."""
-    print(f"Reading components from: {file_path}\n")
+def _run_health_check(comp):
+    """
+    Runs the registered health check for one Component.
+    Returns the component's whole report block as one string, so the caller
+    can emit it with a single write.
+    """
+    if not (comp.type and comp.name):
+        return _SKIP_MSG
+    buf = _report.buf = io.StringIO()
     try:
-        with open(file_path, 'r') as f:
-            deployment_data = yaml.safe_load(f)
-            components = deployment_data.get('components', [])
-            if not components:
-                print("No components found in the deployment file.")
-                return []
-            return components
-    except FileNotFoundError:
-        print(f"Error: The file {file_path} was not found.")
-        return []
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML file: {e}")
-        return []
+        buf.write(_CHECK_FMT(comp.type, comp.name))
+
+        # Dynamic dispatch to the correct health check function
+        check_function = HEALTH_CHECK_REGISTRY.get(comp.type)
+        if not check_function:
+            print(f"  -> Status: Health check not implemented for type '{comp.type}'.", file=buf)
+        else:
+            try:
+                status = check_function(comp.name, comp.properties)
+                print(f"  -> Status: {status}", file=buf)
+            except Exception as e:
+                print(f"  -> An unexpected error occurred during check: {e}", file=buf)
+    finally:
+        _report.buf = None
+    buf.write(_SEP)
+    return buf.getvalue()
 
 # --- Main Execution Logic ---
 if __name__ == "__main__":
     deployment_file = r'C:\Users\SivaReddyKonda\Saved Games\deployment_apply.yaml'
     
-    # Load the entire deployment configuration
-    config = get_deployment_config(deployment_file)
+    # Load the parts of the deployment configuration the checks need
+    config = get_deployment_config(deployment_file, only=HEALTH_CHECK_PATHS)
     
     if not config:
         exit(1)
 
     # Extract region and components
-    region = config.get('spec', {}).get('modulepak', [{}])[0].get('environment', {}).get('awsRegion')
-    components_to_check = config.get('components', [])
+    region = _dig(config, 'spec', 'modulepak', 0, 'environment', 'awsRegion')
+    components_to_check = config.get('components') or []
 
-    # Initialize the client manager with the extracted region
-    client_manager = ClientManager(region=region)
-    
     if components_to_check:
         print("--- Running Health Checks ---\n")
-        for comp in components_to_check:
-            comp_type = comp.get('type')
-            comp_name = comp.get('name')
-            comp_props = comp.get('properties', {})
-
-            if not (comp_type and comp_name):
-                print("Skipping component with missing type or name.\n" + "-"*30)
-                continue
-
-            print(f"Checking {comp_type}: {comp_name}")
-            
-            # Dynamic dispatch to the correct health check function
-            # IAM is global, so it doesn't need a region.
-            is_global_service = comp_type in ["Roles", "GlobalRoles"]
-            
-            # Pass the region to the client manager
-            check_function = HEALTH_CHECK_REGISTRY.get(comp_type)            
-            
-            if check_function:
-                try:
-                    status = check_function(comp_name, comp_props)
-                    print(f"  -> Status: {status}")
-                except Exception as e:
-                    print(f"  -> An unexpected error occurred during check: {e}")
-            else:
-                print(f"  -> Status: Health check not implemented for type '{comp_type}'.")
-            
-            print("-" * 30)
+        components = [Component.from_mapping(c) for c in components_to_check]
+        valid_components = [c for c in components if c.type and c.name]
+
+        # Initialize the client manager with the extracted region and the names
+        # the checks will search the AWS inventories for
+        client_manager = ClientManager(
+            region=region,
+            component_names=[c.name for c in valid_components],
+            component_types=[c.type for c in valid_components],
+        )
+        if valid_components:
+            try:
+                credentials = client_manager.resolve_credentials()
+            except BotoCoreError as e:
+                # e.g. ProfileNotFound for a bad AWS_PROFILE, or an unparsable config file
+                print(f"Error: Could not load AWS credentials: {e}")
+                exit(1)
+            if credentials is None:
+                print("Error: No AWS credentials found. Configure credentials and try again.")
+                exit(1)
+
+        # Resolve all ManagementHosts with one batched EC2 lookup up front. On
+        # failure each check retries on its own and reports its own error.
+        host_names = [c.name for c in valid_components if c.type == 'ManagementHost']
+        if host_names:
+            try:
+                client_manager.cached('management_hosts', lambda: _describe_management_hosts(host_names))
+            except Exception:
+                # e.g. ClientError, or NoRegionError / EndpointConnectionError from botocore
+                pass
+
+        # Each check is dominated by AWS round-trips, so run them concurrently.
+        # executor.map yields results in submission order, so reports (and skip
+        # notices for incomplete components) come out in YAML order.
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(valid_components)))) as executor:
+            for report in executor.map(_run_health_check, components):
+                sys.stdout.write(report)
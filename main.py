@@ -36,26 +36,21 @@ def execute_eac_deployment_status(correlation_id):
     print("-" * 60)
     
     try:
-        # Execute the command
-        result = subprocess.run(
+        # Execute the command, streaming its output line by line instead of
+        # buffering it all until the command exits. stderr goes straight to ours.
+        with subprocess.Popen(
             command,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
             text=True,
-            check=False
-        )
-        
-        # Print the output
-        if result.stdout:
+            bufsize=1
+        ) as proc:
             print("Output:")
-            print(result.stdout)
-        
-        if result.stderr:
-            print("Error output:")
-            print(result.stderr, file=sys.stderr)
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                sys.stdout.flush()
         
         # Return the exit code
-        return result.returncode
+        return proc.returncode
         
     except FileNotFoundError:
         print(f"Error: EAC CLI not found at '{eac_command}'", file=sys.stderr)
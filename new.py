@@ -1,9 +1,67 @@
+import argparse
 import yaml
 import boto3
 import json
+import sys
+import functools
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# libyaml-backed loader when PyYAML was built with it; same results, much faster
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# orjson is optional; it writes the --json report faster and straight to bytes.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+# Shared settings for every AWS client: a connection pool large enough for
+# concurrent checks, adaptive retries on throttling, and kept-alive connections
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+)
+
+# Number of components (and their connections) verified concurrently
+MAX_WORKERS = 16
+
+# Shared read-only default for missing mappings, so lookups don't allocate a fresh {}
+_EMPTY = types.MappingProxyType({})
+
+# Report dividers
+SEP80 = "=" * 80
+DASH80 = "-" * 80
+
+
+def _memoized_verification(resource_type: str, resource_id=None):
+    """
+    Cache a verify_* method's result per (resource_type, id) for the verifier's lifetime.
+    The id is the name argument unless resource_id(name, *args, **kwargs) resolves it.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, name, *args, **kwargs):
+            key = resource_id(name, *args, **kwargs) if resource_id else name
+            return self._cached((resource_type, key), lambda: method(self, name, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
 class AWSServiceVerifier:
     """Verify if services from deployment YAML exist in AWS"""
     
@@ -11,85 +69,148 @@ class AWSServiceVerifier:
         """Initialize AWS clients"""
         self.region = region
         self.clients = {}
+        self._clients_lock = threading.Lock()
+        # One session for all clients, so config files and credentials are resolved once
+        self._session = boto3.session.Session()
+        # Per-run results: (type, name) -> (exists, arn) for verified resources,
+        # shared by main services and connections, plus prefetched inventories
+        self._cache: Dict[Tuple[str, str], object] = {}
+        self._cache_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # Component type -> handler that verifies it and fills in its result
+        self._VERIFIERS = {
+            'RDSAuroraPostgres': self._handle_rds,
+            'KMS': self._handle_kms,
+            'Lightsail': self._handle_lightsail,
+        }
         
     def _get_client(self, service_name: str):
-        """Lazy initialization of AWS clients"""
-        if service_name not in self.clients:
-            self.clients[service_name] = boto3.client(service_name, region_name=self.region)
-        return self.clients[service_name]
+        """Lazy initialization of AWS clients (thread-safe; clients are shared by workers)"""
+        with self._clients_lock:
+            if service_name not in self.clients:
+                self.clients[service_name] = self._session.client(service_name, region_name=self.region, config=CLIENT_CONFIG)
+            return self.clients[service_name]
+    
+    def _cached(self, key: Tuple[str, str], loader):
+        """Run loader() once per key; concurrent callers for the same key wait for the first result"""
+        with self._clients_lock:
+            key_lock = self._cache_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._cache:
+                self._cache[key] = loader()
+            return self._cache[key]
+    
+    def _rds_clusters(self) -> Dict[str, Dict]:
+        """
+        All RDS clusters, fetched (paginated) once per run. Keyed by lowercased
+        identifier (RDS stores identifiers in lowercase and matches them
+        case-insensitively) and by cluster ARN, like describe_db_clusters accepts.
+        """
+        def fetch():
+            paginator = self._get_client('rds').get_paginator('describe_db_clusters')
+            clusters = {}
+            for page in paginator.paginate():
+                for cluster in page['DBClusters']:
+                    clusters[cluster['DBClusterIdentifier'].lower()] = cluster
+                    clusters[cluster['DBClusterArn']] = cluster
+            return clusters
+        return self._cached(('inventory', 'rds'), fetch)
+    
+    def _lightsail_instances(self) -> Dict[str, Dict]:
+        """All Lightsail instances keyed by name, fetched (paginated) once per run"""
+        def fetch():
+            paginator = self._get_client('lightsail').get_paginator('get_instances')
+            return {
+                instance['name']: instance
+                for page in paginator.paginate()
+                for instance in page['instances']
+            }
+        return self._cached(('inventory', 'lightsail'), fetch)
     
     def load_deployment_yaml(self, yaml_file: str) -> Dict:
         """Load and parse the deployment YAML file"""
         try:
             with open(yaml_file, 'r') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_Loader)
         except Exception as e:
             print(f"Error loading YAML file: {e}")
             return None
     
-    def extract_region_from_yaml(self, deployment: Dict) -> str:
-        """Extract AWS region from deployment YAML"""
-        try:
-            env = deployment.get('spec', {}).get('environment', {})
-            region = env.get('awsRegion', 'us-east-1')
-            return region
-        except Exception as e:
-            print(f"Warning: Could not extract region from YAML, using default: {e}")
-            return 'us-east-1'
-    
+    @_memoized_verification(
+        'RDSAuroraPostgres',
+        resource_id=lambda name, properties: properties.get('custom_cluster_name', name),
+    )
     def verify_rds_aurora_postgres(self, name: str, properties: Dict) -> Tuple[bool, Optional[str]]:
         """Verify if RDS Aurora PostgreSQL cluster exists"""
         try:
-            rds_client = self._get_client('rds')
-            response = rds_client.describe_db_clusters(
-                DBClusterIdentifier=properties.get('custom_cluster_name', name)
-            )
-            if response['DBClusters']:
-                cluster = response['DBClusters'][0]
+            cluster_id = properties.get('custom_cluster_name', name)
+            clusters = self._rds_clusters()
+            cluster = clusters.get(cluster_id) or clusters.get(cluster_id.lower())
+            if cluster:
                 return True, cluster['DBClusterArn']
             return False, None
         except ClientError as e:
-            if e.response['Error']['Code'] == 'DBClusterNotFoundFault':
-                return False, None
             print(f"Error checking RDS Aurora cluster '{name}': {e}")
             return False, None
     
+    @_memoized_verification('KMS')
     def verify_kms_key(self, name: str) -> Tuple[bool, Optional[str]]:
         """Verify if KMS key exists"""
         try:
             kms_client = self._get_client('kms')
-            # List all keys and check aliases
-            aliases_response = kms_client.list_aliases()
-            for alias in aliases_response['Aliases']:
-                if alias.get('AliasName') == f"alias/{name}":
-                    key_id = alias.get('TargetKeyId')
-                    key_response = kms_client.describe_key(KeyId=key_id)
-                    return True, key_response['KeyMetadata']['Arn']
+            # describe_key resolves the alias directly - one call, however many keys exist
+            key_response = kms_client.describe_key(KeyId=f"alias/{name}")
+            return True, key_response['KeyMetadata']['Arn']
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NotFoundException', 'AccessDeniedException'):
+                return False, None
+            print(f"Error checking KMS key '{name}': {e}")
             return False, None
         except Exception as e:
             print(f"Error checking KMS key '{name}': {e}")
             return False, None
     
+    @_memoized_verification('Lightsail')
     def verify_lightsail_instance(self, name: str, model: str) -> Tuple[bool, Optional[str]]:
         """Verify if Lightsail instance exists"""
         try:
-            lightsail_client = self._get_client('lightsail')
-            response = lightsail_client.get_instance(instanceName=name)
-            if response['instance']:
-                instance = response['instance']
+            instance = self._lightsail_instances().get(name)
+            if instance:
                 arn = instance.get('arn')
                 return True, arn
             return False, None
         except ClientError as e:
-            if e.response['Error']['Code'] == 'NotFoundException':
-                return False, None
             print(f"Error checking Lightsail instance '{name}': {e}")
             return False, None
     
+    def _handle_rds(self, component: Dict, result: Dict):
+        """Verify an RDSAuroraPostgres component"""
+        properties = component.get('properties') or _EMPTY
+        result['details'] = {
+            'instance_version': component.get('instanceVersion', 'N/A'),
+            'action': component.get('action', 'N/A'),
+            'deployment': component.get('deployment', 'N/A')
+        }
+        result['exists'], result['arn'] = self.verify_rds_aurora_postgres(result['name'], properties)
+    
+    def _handle_kms(self, component: Dict, result: Dict):
+        """Verify a KMS component"""
+        result['exists'], result['arn'] = self.verify_kms_key(result['name'])
+    
+    def _handle_lightsail(self, component: Dict, result: Dict):
+        """Verify a Lightsail component"""
+        model = component.get('model') or ''
+        model_version = component.get('modelVersion', '')
+        result['details'] = {
+            'model': model,
+            'model_version': model_version,
+            'deployment': component.get('deployment', 'N/A')
+        }
+        result['exists'], result['arn'] = self.verify_lightsail_instance(result['name'], model)
+    
     def verify_service_by_type(self, component: Dict) -> Dict:
         """Verify service existence based on component type"""
-        comp_type = component.get('type', '')
-        comp_name = component.get('name', 'unknown')
+        comp_type = component.get('type') or ''
+        comp_name = component.get('name') or 'unknown'
         
         result = {
             'type': comp_type,
@@ -101,37 +222,10 @@ class AWSServiceVerifier:
         }
         
         try:
-            if comp_type == 'RDSAuroraPostgres':
-                properties = component.get('properties', {})
-                result['details'] = {
-                    'instance_version': component.get('instanceVersion', 'N/A'),
-                    'action': component.get('action', 'N/A'),
-                    'deployment': component.get('deployment', 'N/A')
-                }
-                exists, arn = self.verify_rds_aurora_postgres(comp_name, properties)
-                result['exists'] = exists
-                result['arn'] = arn
-                result['status'] = '✓ Found' if exists else '✗ Not Found'
-                
-            elif comp_type == 'KMS':
-                exists, arn = self.verify_kms_key(comp_name)
-                result['exists'] = exists
-                result['arn'] = arn
-                result['status'] = '✓ Found' if exists else '✗ Not Found'
-                
-            elif comp_type == 'Lightsail':
-                model = component.get('model', '')
-                model_version = component.get('modelVersion', '')
-                result['details'] = {
-                    'model': model,
-                    'model_version': model_version,
-                    'deployment': component.get('deployment', 'N/A')
-                }
-                exists, arn = self.verify_lightsail_instance(comp_name, model)
-                result['exists'] = exists
-                result['arn'] = arn
-                result['status'] = '✓ Found' if exists else '✗ Not Found'
-                
+            handler = self._VERIFIERS.get(comp_type)
+            if handler:
+                handler(component, result)
+                result['status'] = '✓ Found' if result['exists'] else '✗ Not Found'
             else:
                 result['status'] = '⚠ Unknown Type'
                 
@@ -141,19 +235,20 @@ class AWSServiceVerifier:
         
         return result
     
-    def verify_connections(self, component: Dict, all_services: List[Dict]) -> List[Dict]:
-        """Verify connected services for a component"""
-        connects_to = component.get('connectsTo', [])
+    def verify_connections(self, component: Dict) -> List[Dict]:
+        """Verify connected services for a component; already-verified resources come from the per-run cache"""
+        connects_to = component.get('connectsTo') or ()
+        parent = component.get('name')
         connected_services = []
         
         for connection in connects_to:
-            conn_type = connection.get('type', '')
-            conn_name = connection.get('name', '')
+            conn_type = connection.get('type') or ''
+            conn_name = connection.get('name') or ''
             
             conn_result = {
                 'type': conn_type,
                 'name': conn_name,
-                'parent': component.get('name'),
+                'parent': parent,
                 'exists': False,
                 'arn': None,
                 'status': '✗ Not Found'
@@ -167,7 +262,7 @@ class AWSServiceVerifier:
                 conn_result['status'] = '✓ Found' if exists else '✗ Not Found'
                 
             elif conn_type == 'Lightsail':
-                model = connection.get('model', '')
+                model = connection.get('model') or ''
                 exists, arn = self.verify_lightsail_instance(conn_name, model)
                 conn_result['exists'] = exists
                 conn_result['arn'] = arn
@@ -183,21 +278,23 @@ class AWSServiceVerifier:
         if not deployment:
             return {}
         
-        # Extract region from YAML
-        if not self.region:
-            self.region = self.extract_region_from_yaml(deployment)
+        # Pull everything needed out of the parsed YAML in one descent
+        metadata = deployment.get('metadata') or _EMPTY
+        model = deployment.get('model') or _EMPTY
+        spec = deployment.get('spec') or _EMPTY
+        environment = spec.get('environment') or _EMPTY
+        module_pack = spec.get('modulePack') or _EMPTY
+        components = spec.get('components') or ()
         
-        # Extract metadata
-        metadata = deployment.get('metadata', {})
-        spec = deployment.get('spec', {})
-        environment = spec.get('environment', {})
+        if not self.region:
+            self.region = environment.get('awsRegion', 'us-east-1')
         
         results = {
             'deployment_name': metadata.get('name', 'unknown'),
             'seal_id': metadata.get('sealID', 'unknown'),
             'model': {
-                'name': deployment.get('model', {}).get('name', 'unknown'),
-                'version': deployment.get('model', {}).get('version', 'unknown')
+                'name': model.get('name', 'unknown'),
+                'version': model.get('version', 'unknown')
             },
             'environment': {
                 'aws_account_id': environment.get('awsAccountID', 'unknown'),
@@ -205,8 +302,8 @@ class AWSServiceVerifier:
                 'organization': environment.get('organization', 'unknown')
             },
             'module_pack': {
-                'name': spec.get('modulePack', {}).get('name', 'unknown'),
-                'version': spec.get('modulePack', {}).get('version', 'unknown')
+                'name': module_pack.get('name', 'unknown'),
+                'version': module_pack.get('version', 'unknown')
             },
             'services': [],
             'connections': []
@@ -215,56 +312,64 @@ class AWSServiceVerifier:
         print(f"Using AWS Region: {self.region}")
         print(f"AWS Account ID: {results['environment']['aws_account_id']}")
         
-        # Parse components from YAML
-        components = spec.get('components', [])
-        
-        for component in components:
-            # Verify main service
-            service_result = self.verify_service_by_type(component)
-            results['services'].append(service_result)
-            
-            # Verify connected services
-            connected = self.verify_connections(component, results['services'])
-            results['connections'].extend(connected)
+        # Each verification is an AWS round-trip, so run them concurrently and
+        # collect the results in YAML order
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                (
+                    executor.submit(self.verify_service_by_type, component),
+                    executor.submit(self.verify_connections, component)
+                )
+                for component in components
+            ]
+            for service_future, connections_future in futures:
+                # Verify main service
+                results['services'].append(service_future.result())
+                
+                # Verify connected services
+                results['connections'].extend(connections_future.result())
         
         return results
     
     def print_results(self, results: Dict):
         """Print verification results in a readable format"""
-        print("\n" + "="*80)
-        print(f"AWS Service Verification Report")
-        print("="*80)
-        print(f"Deployment: {results['deployment_name']}")
-        print(f"Seal ID: {results['seal_id']}")
-        print(f"Model: {results['model']['name']} (v{results['model']['version']})")
-        print(f"Module Pack: {results['module_pack']['name']} (v{results['module_pack']['version']})")
-        print(f"AWS Account: {results['environment']['aws_account_id']}")
-        print(f"AWS Region: {results['environment']['aws_region']}")
-        print(f"Organization: {results['environment']['organization']}")
-        print("-"*80)
+        # Build the whole report and write it once rather than line by line
+        out = []
+        add = out.append
+        add("\n" + SEP80)
+        add(f"AWS Service Verification Report")
+        add(SEP80)
+        add(f"Deployment: {results['deployment_name']}")
+        add(f"Seal ID: {results['seal_id']}")
+        add(f"Model: {results['model']['name']} (v{results['model']['version']})")
+        add(f"Module Pack: {results['module_pack']['name']} (v{results['module_pack']['version']})")
+        add(f"AWS Account: {results['environment']['aws_account_id']}")
+        add(f"AWS Region: {results['environment']['aws_region']}")
+        add(f"Organization: {results['environment']['organization']}")
+        add(DASH80)
         
         # Main services
-        print("\n📦 Main Services:")
-        print("-"*80)
+        add("\n📦 Main Services:")
+        add(DASH80)
         for service in results['services']:
-            print(f"\n{service['status']} [{service['type']}] {service['name']}")
+            add(f"\n{service['status']} [{service['type']}] {service['name']}")
             if service['exists'] and service['arn']:
-                print(f"   ARN: {service['arn']}")
+                add(f"   ARN: {service['arn']}")
             if service.get('details'):
                 for key, value in service['details'].items():
-                    print(f"   {key}: {value}")
+                    add(f"   {key}: {value}")
         
         # Connected services
         if results['connections']:
-            print("\n\n🔗 Connected Services:")
-            print("-"*80)
+            add("\n\n🔗 Connected Services:")
+            add(DASH80)
             for conn in results['connections']:
-                print(f"\n{conn['status']} [{conn['type']}] {conn['name']}")
-                print(f"   Connected to: {conn['parent']}")
+                add(f"\n{conn['status']} [{conn['type']}] {conn['name']}")
+                add(f"   Connected to: {conn['parent']}")
                 if conn['exists'] and conn['arn']:
-                    print(f"   ARN: {conn['arn']}")
+                    add(f"   ARN: {conn['arn']}")
         
-        print("\n" + "="*80)
+        add("\n" + SEP80)
         
         # Summary
         total_services = len(results['services'])
@@ -272,17 +377,22 @@ class AWSServiceVerifier:
         total_connections = len(results['connections'])
         found_connections = sum(1 for c in results['connections'] if c['exists'])
         
-        print(f"📊 Summary:")
-        print(f"   Main Services: {found_services}/{total_services} found")
-        print(f"   Connected Services: {found_connections}/{total_connections} found")
-        print(f"   Total: {found_services + found_connections}/{total_services + total_connections} found")
-        print("="*80 + "\n")
+        add(f"📊 Summary:")
+        add(f"   Main Services: {found_services}/{total_services} found")
+        add(f"   Connected Services: {found_connections}/{total_connections} found")
+        add(f"   Total: {found_services + found_connections}/{total_services + total_connections} found")
+        add(SEP80 + "\n")
+        sys.stdout.write("\n".join(out) + "\n")
         
         return (found_services + found_connections) == (total_services + total_connections)
 
 
-def main():
+def main(argv=None):
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="Verify that services from a deployment YAML exist in AWS")
+    parser.add_argument('--json', metavar='OUT_JSON', help="Also write the verification results to this JSON file")
+    args = parser.parse_args(argv)
+    
     # Configuration
     DEPLOYMENT_FILE = 'deployment_apply.yaml'
     
@@ -299,6 +409,11 @@ def main():
     if results:
         all_exist = verifier.print_results(results)
         
+        if args.json:
+            with open(args.json, 'wb') as f:
+                f.write(_dumps(results))
+            print(f"📝 Results written to {args.json}")
+        
         # Exit code based on results
         if all_exist:
             print("✅ All services verified successfully!")
@@ -1,7 +1,23 @@
 import yaml
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Use the C parser when available, else the pure-Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Settings applied to every client the ClientManager creates.
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+)
+
 class ClientManager:
     """
     Manages and caches Boto3 clients.
@@ -9,15 +25,34 @@ class ClientManager:
     """
     def __init__(self, region=None):
         self._clients = {}
+        self._results = {}
         self.region = region
+        # Every client comes from this one session instead of boto3's implicit
+        # per-call setup, so credentials are looked up a single time.
+        self._session = boto3.session.Session(region_name=region)
 
     def get(self, service_name, region_override=None):
         if service_name not in self._clients:
             # Create the client if it doesn't exist in our cache
             print(f"    (Initializing Boto3 client for '{service_name}'...)")
-            self._clients[service_name] = boto3.client(service_name, region_name=region_override or self.region)
+            self._clients[service_name] = self._session.client(
+                service_name, region_name=region_override or self.region, config=CLIENT_CONFIG
+            )
         return self._clients[service_name]
 
+    def describe_once(self, service_name, method, result_key, **paginate_kwargs):
+        """
+        Returns the full, paginated result list of a describe/list call.
+        The call is made once per run and shared by every component of that type.
+        `paginate_kwargs` are passed to paginate(), e.g. a PaginationConfig for
+        APIs that only page when asked to.
+        """
+        key = (service_name, method)
+        if key not in self._results:
+            paginator = self.get(service_name).get_paginator(method)
+            self._results[key] = paginator.paginate(**paginate_kwargs).build_full_result().get(result_key, [])
+        return self._results[key]
+
 # --- Central Client Manager ---
 # This will be initialized later with the region from the deployment file.
 client_manager = None
@@ -28,8 +63,7 @@ client_manager = None
 def _check_rds_aurora(name, properties):
     """Health check for RDSAuroraPostgres."""
     try:
-        rds_client = client_manager.get('rds')
-        clusters = rds_client.describe_db_clusters()['DBClusters']
+        clusters = client_manager.describe_once('rds', 'describe_db_clusters', 'DBClusters')
         # Search for a cluster where the name from YAML is part of the real name
         cluster = next((c for c in clusters if name in c['DBClusterIdentifier']), None)
         if cluster:
@@ -44,12 +78,14 @@ def _check_management_host(name, properties):
         ec2_client = client_manager.get('ec2')
         # A common convention is to have a 'Name' tag. We search for a tag containing the name.
         filters = [{'Name': 'tag:Name', 'Values': [f'*{name}*']}]
-        reservations = ec2_client.describe_instances(Filters=filters)['Reservations']
+        # Filtered results can come back as empty pages with a NextToken, so walk
+        # the pages and stop at the first match.
+        pages = ec2_client.get_paginator('describe_instances').paginate(Filters=filters)
+        instance = next((i for page in pages for r in page['Reservations'] for i in r['Instances']), None)
         
-        if not reservations or not reservations[0]['Instances']:
+        if instance is None:
             return f"Instance with name tag like '*{name}*' not found."
 
-        instance = reservations[0]['Instances'][0]
         instance_id = instance['InstanceId']
         state = instance['State']['Name']
         
@@ -67,8 +103,7 @@ def _check_management_host(name, properties):
 def _check_load_balancer(name, properties):
     """Health check for ApplicationLoadBalancer and NetworkLoadBalancer."""
     try:
-        elbv2_client = client_manager.get('elbv2')
-        lbs = elbv2_client.describe_load_balancers()['LoadBalancers']
+        lbs = client_manager.describe_once('elbv2', 'describe_load_balancers', 'LoadBalancers')
         # Search for a load balancer where the name from YAML is part of the real name
         lb = next((l for l in lbs if name in l['LoadBalancerName']), None)
         if lb:
@@ -80,8 +115,7 @@ def _check_load_balancer(name, properties):
 def _check_iam_role(name, properties):
     """Health check for Roles and GlobalRoles."""
     try:
-        iam_client = client_manager.get('iam')
-        roles = iam_client.list_roles()['Roles']
+        roles = client_manager.describe_once('iam', 'list_roles', 'Roles')
         role = next((r for r in roles if name in r['RoleName']), None)
         if role:
              return f"Found Role containing name: {role['RoleName']}"
@@ -122,9 +156,11 @@ def _check_kms_key(name, properties):
 def _check_sqs_queue(name, properties):
     """Health check for SQS queues."""
     try:
-        sqs_client = client_manager.get('sqs')
-        response = sqs_client.list_queues()
-        queue_urls = response.get('QueueUrls', [])
+        # ListQueues only returns a NextToken when MaxResults is sent; without a page
+        # size it stops at 1000 queues.
+        queue_urls = client_manager.describe_once(
+            'sqs', 'list_queues', 'QueueUrls', PaginationConfig={'PageSize': 1000}
+        )
         queue_url = next((url for url in queue_urls if name in url), None)
         if queue_url:
             return f"Found SQS Queue: {queue_url}"
@@ -135,8 +171,7 @@ def _check_sqs_queue(name, properties):
 def _check_lambda_function(name, properties):
     """Health check for Lambda functions."""
     try:
-        lambda_client = client_manager.get('lambda')
-        functions = lambda_client.list_functions()['Functions']
+        functions = client_manager.describe_once('lambda', 'list_functions', 'Functions')
         func = next((f for f in functions if name in f['FunctionName']), None)
         if func:
             return f"Found Lambda: {func['FunctionName']}, Runtime: {func['Runtime']}, State: {func.get('State', 'N/A')}"
@@ -164,11 +199,15 @@ HEALTH_CHECK_REGISTRY = {
     "KMS": _check_kms_key,
 }
 
+# --- Report dividers ---
+_LIST_RULE = "-" * 43
+_SEP = "-" * 30
+
 def run_health_checks(deployment_yaml_path):
     global client_manager
     try:
         with open(deployment_yaml_path, "r") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_Loader)
     except FileNotFoundError:
         print(f"Error: The file {deployment_yaml_path} was not found.")
         return
@@ -198,7 +237,7 @@ def run_health_checks(deployment_yaml_path):
         comp_name = comp.get('name')
         if comp_type and comp_name:
             print(f"Type: {comp_type}, Name: {comp_name}")
-    print("-" * 43 + "\n")
+    print(_LIST_RULE + "\n")
 
     print("--- Running Health Checks ---\n")
     for comp in components_to_check:
@@ -207,7 +246,7 @@ def run_health_checks(deployment_yaml_path):
         comp_props = comp.get('properties', {})
 
         if not (comp_type and comp_name):
-            print("Skipping component with missing type or name.\n" + "-"*30)
+            print("Skipping component with missing type or name.\n" + _SEP)
             continue
 
         print(f"Checking {comp_type}: {comp_name}")
@@ -223,7 +262,7 @@ def run_health_checks(deployment_yaml_path):
         else:
             print(f"  -> Status: Health check not implemented for type '{comp_type}'.")
         
-        print("-" * 30)
+        print(_SEP)
 
 if __name__ == "__main__":
     # Update this path to your YAML file location
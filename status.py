@@ -1,14 +1,11 @@
-import subprocess
+import sys
+
+import eac_status
 
 # Specify the full path to eac.exe
 EAC_PATH = r"\\JPMC\DEV\TMP\ds\tools\eac-cli\latest\eac.exe"
-# Build the full command as a list
-CMD = [EAC_PATH, "deployment", "status", "-f", "deployment_apply.yaml"]
-
-# Run the command and capture the output
-result = subprocess.run(CMD, capture_output=True, text=True)
+# Deployment YAML to report on
+DEPLOYMENT_YAML_PATH = "deployment_apply.yaml"
 
-# Print stdout (command output)
-print("STDOUT:\n", result.stdout)
-# Print stderr (any errors)
-print("STDERR:\n", result.stderr)
+# Run the command and stream its output as it is produced
+sys.exit(eac_status.main([EAC_PATH, DEPLOYMENT_YAML_PATH]))
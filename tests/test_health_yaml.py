@@ -0,0 +1,145 @@
+import io
+import os
+import sys
+
+import pytest
+import yaml
+
+pytest.importorskip("botocore")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import health  # noqa: E402
+
+
+def _project(value, paths):
+    """Reference projection of a fully loaded document onto `paths` (what _parse_yaml promises)."""
+    if any(not path for path in paths):
+        return value
+    children = {}
+    for path in paths:
+        children.setdefault(path[0], []).append(path[1:])
+    if isinstance(value, dict):
+        return {k: _project(v, children[k]) for k, v in value.items() if k in children}
+    if isinstance(value, list):
+        wanted = [i for i in children if isinstance(i, int) and i < len(value)]
+        result = [None] * (max(wanted) + 1) if wanted else []
+        for i in wanted:
+            result[i] = _project(value[i], children[i])
+        return result
+    return None
+
+
+def _check(text, paths=health.HEALTH_CHECK_PATHS):
+    expected = yaml.safe_load(text)
+    if expected is not None:
+        expected = _project(expected, paths)
+    assert health._parse_yaml(io.StringIO(text), paths) == expected
+
+
+def _check_rejected(text, paths=health.HEALTH_CHECK_PATHS):
+    with pytest.raises(yaml.composer.ComposerError):
+        yaml.safe_load(text)
+    with pytest.raises(yaml.composer.ComposerError):
+        health._parse_yaml(io.StringIO(text), paths)
+
+
+def test_plain_document():
+    _check("""
+metadata: {name: dep}
+spec:
+  modulepak:
+    - environment: {awsRegion: us-east-1, awsAccountID: '123'}
+      other: [1, 2, 3]
+components:
+  - {type: KMS, name: key1, properties: {key_alias: a}}
+  - type: SQS
+    name: q
+""")
+
+
+def test_anchor_defined_in_skipped_section():
+    _check("""
+metadata:
+  defaults: &props {key_alias: shared, tags: [x, y]}
+  region: &region eu-west-1
+spec:
+  modulepak:
+    - environment: {awsRegion: *region}
+components:
+  - {type: KMS, name: key1, properties: *props}
+  - {type: KMS, name: key2, properties: *props}
+""")
+
+
+def test_merge_keys():
+    _check("""
+base: &base
+  environment: {awsRegion: ap-south-1}
+spec:
+  modulepak:
+    - <<: *base
+      name: first
+components:
+  - <<: {type: Lambda, properties: {timeout: 3}}
+    name: fn
+""")
+
+
+def test_merge_key_on_the_root_mapping():
+    _check("""
+defaults: &defaults
+  components:
+    - {type: SQS, name: q}
+<<: *defaults
+spec: {modulepak: [{environment: {awsRegion: us-west-2}}]}
+""")
+
+
+def test_non_zero_modulepak_index():
+    text = """
+spec:
+  modulepak:
+    - environment: {awsRegion: us-east-1}
+    - environment: {awsRegion: eu-west-1}
+    - environment: {awsRegion: sa-east-1, awsAccountID: '9'}
+components: []
+"""
+    _check(text)
+    _check(text, (('spec', 'modulepak', 2, 'environment', 'awsRegion'), ('components',)))
+    _check(text, (('spec', 'modulepak', 5, 'environment'),))
+    _check(text, (('spec', 'modulepak', 1, 'environment'), ('spec', 'modulepak', 7)))
+
+
+def test_missing_and_mismatched_paths():
+    _check("spec: {modulepak: just-a-string}\ncomponents: null\n")
+    _check("spec: [1, 2]\n")
+    _check("- a\n- b\n")
+    _check("just a scalar\n")
+
+
+@pytest.mark.parametrize("text", ["", "\n", "# only a comment\n", "---\n", "--- \n...\n"])
+def test_empty_documents(text):
+    _check(text)
+
+
+def test_multiple_documents_are_rejected():
+    _check_rejected("components: [{type: SQS, name: q}]\n---\nother: 1\n")
+    _check_rejected("--- {components: []}\n--- \n")
+
+
+@pytest.mark.parametrize("text", [
+    # both copies in skipped sections
+    "a: &x 1\nb: &x 2\ncomponents: []\n",
+    # one skipped, one selected
+    "meta: &x {k: 1}\ncomponents: &x [{type: SQS, name: q}]\n",
+    # both inside the selected subtree
+    "components: [&x {type: SQS, name: a}, &x {type: SQS, name: b}]\n",
+    # on a selected key
+    "&x components: []\nother: &x 1\n",
+])
+def test_duplicate_anchors_are_rejected(text):
+    _check_rejected(text)
+
+
+def test_alias_to_selected_node():
+    _check("components: &c [{type: SQS, name: q}]\nspec: {modulepak: [{environment: {awsRegion: *c}}]}\n")